@@ -501,7 +501,12 @@ def _cached_async_http_client(provider: str | None, timeout: int = 600, connect:
 
 @cache
 def _cached_async_http_transport() -> httpx.AsyncHTTPTransport:
-    return httpx.AsyncHTTPTransport()
+    # Keep idle connections around for longer than httpx's 5s default, so that consecutive requests in an agent run
+    # (which are often separated by tool calls) reuse the pooled connection instead of paying for a new TLS handshake.
+    # `httpx.Limits` leaves any limit that isn't passed unbounded, so httpx's default connection limits are repeated here.
+    return httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30)
+    )
 
 
 @cache
@@ -1,11 +1,10 @@
 from __future__ import annotations as _annotations
 
-from collections.abc import Iterable
 from dataclasses import dataclass, field
 from itertools import chain
-from typing import Literal, Union, cast
+from typing import Literal, Union
 
-from typing_extensions import assert_never
+from typing_extensions import TypedDict, assert_never
 
 from pydantic_ai.exceptions import UserError
 
@@ -87,6 +86,10 @@ class CohereModelSettings(ModelSettings):
     # This class is a placeholder for any future cohere-specific settings
 
 
+_EMPTY_SETTINGS: CohereModelSettings = {}
+"""Settings used when a request is made without any, shared so they don't need to be created for each request."""
+
+
 @dataclass(init=False)
 class CohereModel(Model):
     """A model that uses the Cohere API.
@@ -101,6 +104,7 @@ class CohereModel(Model):
 
     _model_name: CohereModelName = field(repr=False)
     _system: str = field(default='cohere', repr=False)
+    _tools_cache: list[ToolV2] | None = field(default=None, repr=False, compare=False)
 
     def __init__(
         self,
@@ -118,6 +122,7 @@ class CohereModel(Model):
                 created using the other parameters.
         """
         self._model_name = model_name
+        self._tools_cache = None
 
         if isinstance(provider, str):
             provider = infer_provider(provider)
@@ -135,7 +140,9 @@ class CohereModel(Model):
         model_request_parameters: ModelRequestParameters,
     ) -> tuple[ModelResponse, usage.Usage]:
         check_allow_model_requests()
-        response = await self._chat(messages, cast(CohereModelSettings, model_settings or {}), model_request_parameters)
+        response = await self._chat(
+            messages, model_settings if model_settings is not None else _EMPTY_SETTINGS, model_request_parameters
+        )
         return self._process_response(response), _map_usage(response)
 
     @property
@@ -156,20 +163,30 @@ class CohereModel(Model):
     ) -> ChatResponse:
         tools = self._get_tools(model_request_parameters)
         tool_choice = self._map_tool_choice(model_settings, model_request_parameters, tools)
-        cohere_messages = list(chain(*(self._map_message(m) for m in messages)))
+        cohere_messages = list(chain.from_iterable(self._map_message(m) for m in messages))
+        # only pass the settings that are set, rather than `OMIT` for each of the others
+        chat_settings: _CohereChatSettings = {}
+        if 'max_tokens' in model_settings:
+            chat_settings['max_tokens'] = model_settings['max_tokens']
+        if 'stop_sequences' in model_settings:
+            chat_settings['stop_sequences'] = model_settings['stop_sequences']
+        if 'temperature' in model_settings:
+            chat_settings['temperature'] = model_settings['temperature']
+        if 'top_p' in model_settings:
+            chat_settings['p'] = model_settings['top_p']
+        if 'seed' in model_settings:
+            chat_settings['seed'] = model_settings['seed']
+        if 'presence_penalty' in model_settings:
+            chat_settings['presence_penalty'] = model_settings['presence_penalty']
+        if 'frequency_penalty' in model_settings:
+            chat_settings['frequency_penalty'] = model_settings['frequency_penalty']
         try:
             return await self.client.chat(
                 model=self._model_name,
                 messages=cohere_messages,
                 tools=tools or OMIT,
                 tool_choice=tool_choice or OMIT,
-                max_tokens=model_settings.get('max_tokens', OMIT),
-                stop_sequences=model_settings.get('stop_sequences', OMIT),
-                temperature=model_settings.get('temperature', OMIT),
-                p=model_settings.get('top_p', OMIT),
-                seed=model_settings.get('seed', OMIT),
-                presence_penalty=model_settings.get('presence_penalty', OMIT),
-                frequency_penalty=model_settings.get('frequency_penalty', OMIT),
+                **chat_settings,
             )
         except ApiError as e:
             if (status_code := e.status_code) and status_code >= 400:
@@ -195,10 +212,10 @@ class CohereModel(Model):
                 )
         return ModelResponse(parts=parts, model_name=self._model_name)
 
-    def _map_message(self, message: ModelMessage) -> Iterable[ChatMessageV2]:
+    def _map_message(self, message: ModelMessage) -> list[ChatMessageV2]:
         """Just maps a `pydantic_ai.Message` to a `cohere.ChatMessageV2`."""
         if isinstance(message, ModelRequest):
-            yield from self._map_user_message(message)
+            return self._map_user_message(message)
         elif isinstance(message, ModelResponse):
             texts: list[str] = []
             tool_calls: list[ToolCallV2] = []
@@ -211,19 +228,35 @@ class CohereModel(Model):
                     assert_never(item)
             message_param = AssistantChatMessageV2(role='assistant')
             if texts:
-                message_param.content = [TextAssistantMessageContentItem(text='\n\n'.join(texts))]
+                text = texts[0] if len(texts) == 1 else '\n\n'.join(texts)
+                message_param.content = [TextAssistantMessageContentItem(text=text)]
             if tool_calls:
                 message_param.tool_calls = tool_calls
-            yield message_param
+            return [message_param]
         else:
             assert_never(message)
 
     def _get_tools(self, model_request_parameters: ModelRequestParameters) -> list[ToolV2]:
-        tools = [self._map_tool_definition(r) for r in model_request_parameters.function_tools]
-        if model_request_parameters.output_tools:
-            tools += [self._map_tool_definition(r) for r in model_request_parameters.output_tools]
+        tool_defs = model_request_parameters.function_tools + model_request_parameters.output_tools
+        # Tool definitions are rebuilt for every step of an agent run, but are usually the same as in the previous
+        # step, so reuse the mapped tools. `prepare` functions can edit the schema they share with the previous
+        # definitions in place, so compare with the tools that were built rather than with the previous definitions.
+        tools = self._tools_cache
+        if tools is None or not self._tools_match(tools, tool_defs):
+            tools = self._tools_cache = [self._map_tool_definition(r) for r in tool_defs]
         return tools
 
+    @staticmethod
+    def _tools_match(tools: list[ToolV2], tool_defs: list[ToolDefinition]) -> bool:
+        """Whether `tools` are what `_map_tool_definition` would map `tool_defs` to."""
+        return len(tools) == len(tool_defs) and all(
+            t.function is not None
+            and t.function.name == f.name
+            and t.function.description == f.description
+            and t.function.parameters == f.parameters_json_schema
+            for t, f in zip(tools, tool_defs)
+        )
+
     @staticmethod
     def _map_tool_choice(
         model_settings: CohereModelSettings, model_request_parameters: ModelRequestParameters, tools: list[ToolV2]
@@ -272,32 +305,50 @@ class CohereModel(Model):
         )
 
     @classmethod
-    def _map_user_message(cls, message: ModelRequest) -> Iterable[ChatMessageV2]:
+    def _map_user_message(cls, message: ModelRequest) -> list[ChatMessageV2]:
+        cohere_messages: list[ChatMessageV2] = []
         for part in message.parts:
             if isinstance(part, SystemPromptPart):
-                yield SystemChatMessageV2(role='system', content=part.content)
+                cohere_messages.append(SystemChatMessageV2(role='system', content=part.content))
             elif isinstance(part, UserPromptPart):
                 if isinstance(part.content, str):
-                    yield UserChatMessageV2(role='user', content=part.content)
+                    cohere_messages.append(UserChatMessageV2(role='user', content=part.content))
                 else:
                     raise RuntimeError('Cohere does not yet support multi-modal inputs.')
             elif isinstance(part, ToolReturnPart):
-                yield ToolChatMessageV2(
-                    role='tool',
-                    tool_call_id=_guard_tool_call_id(t=part),
-                    content=part.model_response_str(),
+                cohere_messages.append(
+                    ToolChatMessageV2(
+                        role='tool',
+                        tool_call_id=_guard_tool_call_id(t=part),
+                        content=part.model_response_str(),
+                    )
                 )
             elif isinstance(part, RetryPromptPart):
                 if part.tool_name is None:
-                    yield UserChatMessageV2(role='user', content=part.model_response())
+                    cohere_messages.append(UserChatMessageV2(role='user', content=part.model_response()))
                 else:
-                    yield ToolChatMessageV2(
-                        role='tool',
-                        tool_call_id=_guard_tool_call_id(t=part),
-                        content=part.model_response(),
+                    cohere_messages.append(
+                        ToolChatMessageV2(
+                            role='tool',
+                            tool_call_id=_guard_tool_call_id(t=part),
+                            content=part.model_response(),
+                        )
                     )
             else:
                 assert_never(part)
+        return cohere_messages
+
+
+class _CohereChatSettings(TypedDict, total=False):
+    """The arguments of `AsyncClientV2.chat` that are set from the model settings."""
+
+    max_tokens: int
+    stop_sequences: list[str]
+    temperature: float
+    p: float
+    seed: int
+    presence_penalty: float
+    frequency_penalty: float
 
 
 def _map_usage(response: ChatResponse) -> usage.Usage:
@@ -306,18 +357,20 @@ def _map_usage(response: ChatResponse) -> usage.Usage:
         return usage.Usage()
     else:
         details: dict[str, int] = {}
-        if u.billed_units is not None:
-            if u.billed_units.input_tokens:
-                details['input_tokens'] = int(u.billed_units.input_tokens)
-            if u.billed_units.output_tokens:
-                details['output_tokens'] = int(u.billed_units.output_tokens)
-            if u.billed_units.search_units:  # pragma: no cover
-                details['search_units'] = int(u.billed_units.search_units)
-            if u.billed_units.classifications:  # pragma: no cover
-                details['classifications'] = int(u.billed_units.classifications)
-
-        request_tokens = int(u.tokens.input_tokens) if u.tokens and u.tokens.input_tokens else None
-        response_tokens = int(u.tokens.output_tokens) if u.tokens and u.tokens.output_tokens else None
+        if (billed_units := u.billed_units) is not None:
+            if billed_units.input_tokens:
+                details['input_tokens'] = int(billed_units.input_tokens)
+            if billed_units.output_tokens:
+                details['output_tokens'] = int(billed_units.output_tokens)
+            if billed_units.search_units:  # pragma: no cover
+                details['search_units'] = int(billed_units.search_units)
+            if billed_units.classifications:  # pragma: no cover
+                details['classifications'] = int(billed_units.classifications)
+
+        request_tokens = response_tokens = None
+        if (tokens := u.tokens) is not None:
+            request_tokens = int(tokens.input_tokens) if tokens.input_tokens else None
+            response_tokens = int(tokens.output_tokens) if tokens.output_tokens else None
         return usage.Usage(
             request_tokens=request_tokens,
             response_tokens=response_tokens,
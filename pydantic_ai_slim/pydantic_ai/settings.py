@@ -170,6 +170,9 @@ class ModelSettings(TypedDict, total=False):
 class ForcedFunctionToolChoice:
     """A tool choice that forces the model to use a specific function."""
 
+    # `@dataclass(slots=True)` requires Python 3.10
+    __slots__ = ('tool',)
+
     tool: Tool | ToolFuncEither | str
     """The tool to call."""
 
@@ -189,7 +192,7 @@ def merge_model_settings(base: ModelSettings | None, overrides: ModelSettings |
     A common use case is: merge_model_settings(<agent settings>, <run settings>)
     """
     # Note: we may want merge recursively if/when we add non-primitive values
-    if base and overrides:
+    if base and overrides and base is not overrides:
         return base | overrides
     else:
         return base or overrides
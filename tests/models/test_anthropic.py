@@ -1,11 +1,9 @@
 from __future__ import annotations as _annotations
 
 import json
-import os
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import timezone
-from functools import cached_property
 from typing import Any, TypeVar, Union, cast
 
 import httpx
@@ -76,6 +74,18 @@ def test_init():
     assert m.base_url == 'https://api.anthropic.com'
 
 
+class MockMessages:
+    """Stands in for `AsyncAnthropic.messages`, forwarding `create` to the mock client."""
+
+    __slots__ = ('_client',)
+
+    def __init__(self, client: MockAnthropic):
+        self._client = client
+
+    async def create(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._client.messages_create(*args, **kwargs)
+
+
 @dataclass
 class MockAnthropic:
     messages_: MockAnthropicMessage | Sequence[MockAnthropicMessage] | None = None
@@ -83,10 +93,10 @@ class MockAnthropic:
     index = 0
     chat_completion_kwargs: list[dict[str, Any]] = field(default_factory=list)
     base_url: str | None = None
+    messages: MockMessages = field(init=False, repr=False)
 
-    @cached_property
-    def messages(self) -> Any:
-        return type('Messages', (), {'create': self.messages_create})
+    def __post_init__(self):
+        self.messages = MockMessages(self)
 
     @classmethod
     def create_mock(cls, messages_: MockAnthropicMessage | Sequence[MockAnthropicMessage]) -> AsyncAnthropic:
@@ -122,7 +132,8 @@ class MockAnthropic:
 
 
 def completion_message(content: list[ContentBlock], usage: AnthropicUsage) -> AnthropicMessage:
-    return AnthropicMessage(
+    # the arguments are trusted, so skip validation
+    return AnthropicMessage.model_construct(
         id='123',
         content=content,
         model='claude-3-5-haiku-123',
@@ -345,7 +356,6 @@ async def test_parallel_tool_calls(allow_model_requests: None, parallel_tool_cal
     )
 
 
-@pytest.mark.vcr
 async def test_multiple_parallel_tool_calls(allow_model_requests: None):
     async def retrieve_entity_info(name: str) -> str:
         """Get the knowledge about the given entity."""
@@ -364,11 +374,61 @@ async def test_multiple_parallel_tool_calls(allow_model_requests: None):
     Think step by step and then provide a single most probable concise answer.
     """
 
-    # If we don't provide some value for the API key, the anthropic SDK will raise an error.
-    # However, we do want to use the environment variable if present when rewriting VCR cassettes.
-    api_key = os.environ.get('ANTHROPIC_API_KEY', 'mock-value')
+    responses = [
+        completion_message(
+            [
+                TextBlock(
+                    text="I'll retrieve the information about each family member to determine their ages.", type='text'
+                ),
+                ToolUseBlock(
+                    id='toolu_01GqTEj62q5VBiG1mMFcZ7hE',
+                    input={'name': 'Alice'},
+                    name='retrieve_entity_info',
+                    type='tool_use',
+                ),
+                ToolUseBlock(
+                    id='toolu_01HEMkf9mGmss65HbM4E1K8Z',
+                    input={'name': 'Bob'},
+                    name='retrieve_entity_info',
+                    type='tool_use',
+                ),
+                ToolUseBlock(
+                    id='toolu_01VodXtCizVDfWstMmmgf2Wm',
+                    input={'name': 'Charlie'},
+                    name='retrieve_entity_info',
+                    type='tool_use',
+                ),
+                ToolUseBlock(
+                    id='toolu_01EEJV6Tiy89J1qcBHVoVeRc',
+                    input={'name': 'Daisy'},
+                    name='retrieve_entity_info',
+                    type='tool_use',
+                ),
+            ],
+            AnthropicUsage(input_tokens=429, output_tokens=186),
+        ),
+        completion_message(
+            [
+                TextBlock(
+                    text="""\
+Based on the retrieved information, I can determine the family relationships:
+- Alice and Bob are married
+- Charlie is their son
+- Daisy is their daughter and Charlie's younger sister
+
+Since Daisy is explicitly mentioned as Charlie's younger sister, Daisy is the youngest in this family.
+
+The answer is: Daisy is the youngest.\
+""",
+                    type='text',
+                )
+            ],
+            AnthropicUsage(input_tokens=761, output_tokens=79),
+        ),
+    ]
+    mock_client = MockAnthropic.create_mock(responses)
     agent = Agent(
-        AnthropicModel('claude-3-5-haiku-latest', provider=AnthropicProvider(api_key=api_key)),
+        AnthropicModel('claude-3-5-haiku-latest', provider=AnthropicProvider(anthropic_client=mock_client)),
         system_prompt=system_prompt,
         tools=[retrieve_entity_info],
     )
@@ -458,72 +518,74 @@ async def test_stream_structured(allow_model_requests: None):
     6. Message stop
     """
     stream = [
-        RawMessageStartEvent(
+        RawMessageStartEvent.model_construct(
             type='message_start',
-            message=AnthropicMessage(
+            message=AnthropicMessage.model_construct(
                 id='msg_123',
                 model='claude-3-5-haiku-latest',
                 role='assistant',
                 type='message',
                 content=[],
                 stop_reason=None,
-                usage=AnthropicUsage(input_tokens=20, output_tokens=0),
+                usage=AnthropicUsage.model_construct(input_tokens=20, output_tokens=0),
             ),
         ),
         # Start tool block with initial data
-        RawContentBlockStartEvent(
+        RawContentBlockStartEvent.model_construct(
             type='content_block_start',
             index=0,
-            content_block=ToolUseBlock(type='tool_use', id='tool_1', name='my_tool', input={'first': 'One'}),
+            content_block=ToolUseBlock.model_construct(
+                type='tool_use', id='tool_1', name='my_tool', input={'first': 'One'}
+            ),
         ),
         # Add more data through an incomplete JSON delta
-        RawContentBlockDeltaEvent(
+        RawContentBlockDeltaEvent.model_construct(
             type='content_block_delta',
             index=0,
-            delta=InputJSONDelta(type='input_json_delta', partial_json='{"second":'),
+            delta=InputJSONDelta.model_construct(type='input_json_delta', partial_json='{"second":'),
         ),
-        RawContentBlockDeltaEvent(
+        RawContentBlockDeltaEvent.model_construct(
             type='content_block_delta',
             index=0,
-            delta=InputJSONDelta(type='input_json_delta', partial_json='"Two"}'),
+            delta=InputJSONDelta.model_construct(type='input_json_delta', partial_json='"Two"}'),
         ),
         # Mark tool block as complete
-        RawContentBlockStopEvent(type='content_block_stop', index=0),
+        RawContentBlockStopEvent.model_construct(type='content_block_stop', index=0),
         # Update the top-level message with usage
-        RawMessageDeltaEvent(
+        RawMessageDeltaEvent.model_construct(
             type='message_delta',
-            delta=Delta(
+            delta=Delta.model_construct(
                 stop_reason='end_turn',
             ),
-            usage=MessageDeltaUsage(
+            usage=MessageDeltaUsage.model_construct(
                 output_tokens=5,
             ),
         ),
         # Mark message as complete
-        RawMessageStopEvent(type='message_stop'),
+        RawMessageStopEvent.model_construct(type='message_stop'),
     ]
 
     done_stream = [
-        RawMessageStartEvent(
+        RawMessageStartEvent.model_construct(
             type='message_start',
-            message=AnthropicMessage(
+            message=AnthropicMessage.model_construct(
                 id='msg_123',
                 model='claude-3-5-haiku-latest',
                 role='assistant',
                 type='message',
                 content=[],
                 stop_reason=None,
-                usage=AnthropicUsage(input_tokens=0, output_tokens=0),
+                usage=AnthropicUsage.model_construct(input_tokens=0, output_tokens=0),
             ),
         ),
         # Text block with final data
-        RawContentBlockStartEvent(
+        RawContentBlockStartEvent.model_construct(
             type='content_block_start',
             index=0,
-            content_block=TextBlock(type='text', text='FINAL_PAYLOAD'),
+            content_block=TextBlock.model_construct(type='text', text='FINAL_PAYLOAD'),
         ),
-        RawContentBlockStopEvent(type='content_block_stop', index=0),
-        RawMessageStopEvent(type='message_stop'),
+        RawContentBlockStopEvent.model_construct(type='content_block_stop', index=0),
+        RawMessageStopEvent.model_construct(type='message_stop'),
     ]
 
     mock_client = MockAnthropic.create_stream_mock([stream, done_stream])
@@ -555,9 +617,18 @@ async def test_stream_structured(allow_model_requests: None):
         assert tool_called
 
 
-@pytest.mark.vcr()
-async def test_image_url_input(allow_model_requests: None, anthropic_api_key: str):
-    m = AnthropicModel('claude-3-5-haiku-latest', provider=AnthropicProvider(api_key=anthropic_api_key))
+async def test_image_url_input(allow_model_requests: None):
+    c = completion_message(
+        [
+            TextBlock(
+                text="This is a potato. It's a yellow-brown, oblong-shaped potato with a smooth skin and some small eyes or blemishes visible on its surface. Potatoes are starchy root vegetables that are a staple food in many cuisines around the world. They can be prepared in numerous ways, such as boiling, baking, frying, or mashing, and are rich in carbohydrates and nutrients.",
+                type='text',
+            )
+        ],
+        AnthropicUsage(input_tokens=296, output_tokens=93),
+    )
+    mock_client = MockAnthropic.create_mock(c)
+    m = AnthropicModel('claude-3-5-haiku-latest', provider=AnthropicProvider(anthropic_client=mock_client))
     agent = Agent(m)
 
     result = await agent.run(
@@ -569,6 +640,23 @@ async def test_image_url_input(allow_model_requests: None, anthropic_api_key: st
     assert result.output == snapshot(
         "This is a potato. It's a yellow-brown, oblong-shaped potato with a smooth skin and some small eyes or blemishes visible on its surface. Potatoes are starchy root vegetables that are a staple food in many cuisines around the world. They can be prepared in numerous ways, such as boiling, baking, frying, or mashing, and are rich in carbohydrates and nutrients."
     )
+    assert get_mock_chat_completion_kwargs(mock_client)[0]['messages'] == snapshot(
+        [
+            {
+                'role': 'user',
+                'content': [
+                    {'text': 'What is this vegetable?', 'type': 'text'},
+                    {
+                        'source': {
+                            'type': 'url',
+                            'url': 'https://t3.ftcdn.net/jpg/00/85/79/92/360_F_85799278_0BBGV9OAdQDTLnKwAPBCcg1J7QtiieJY.jpg',
+                        },
+                        'type': 'image',
+                    },
+                ],
+            }
+        ]
+    )
 
 
 @pytest.mark.vcr()
@@ -2,14 +2,14 @@ from __future__ import annotations as _annotations
 
 import json
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timezone
 from typing import Any, Union, cast
 
 import pytest
 from inline_snapshot import snapshot
 
-from pydantic_ai import Agent, ModelHTTPError, ModelRetry
+from pydantic_ai import Agent, ModelHTTPError, ModelRetry, RunContext
 from pydantic_ai.messages import (
     ImageUrl,
     ModelRequest,
@@ -21,6 +21,8 @@ from pydantic_ai.messages import (
     ToolReturnPart,
     UserPromptPart,
 )
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.tools import ToolDefinition
 from pydantic_ai.usage import Usage
 
 from ..conftest import IsNow, raise_if_exception, try_import
@@ -28,14 +30,17 @@ from ..conftest import IsNow, raise_if_exception, try_import
 with try_import() as imports_successful:
     import cohere
     from cohere import (
+        AssistantChatMessageV2,
         AssistantMessageResponse,
         AsyncClientV2,
         ChatResponse,
+        TextAssistantMessageContentItem,
         TextAssistantMessageResponseContentItem,
         ToolCallV2,
         ToolCallV2Function,
     )
     from cohere.core.api_error import ApiError
+    from cohere.v2.client import OMIT
 
     from pydantic_ai.models.cohere import CohereModel
     from pydantic_ai.providers.cohere import CohereProvider
@@ -60,14 +65,16 @@ def test_init():
 class MockAsyncClientV2:
     completions: MockChatResponse | Sequence[MockChatResponse] | None = None
     index = 0
+    chat_kwargs: list[dict[str, Any]] = field(default_factory=list)
 
     @classmethod
     def create_mock(cls, completions: MockChatResponse | Sequence[MockChatResponse]) -> AsyncClientV2:
         return cast(AsyncClientV2, cls(completions=completions))
 
     async def chat(  # pragma: no cover
-        self, *_args: Any, **_kwargs: Any
+        self, *_args: Any, **kwargs: Any
     ) -> ChatResponse:
+        self.chat_kwargs.append(kwargs)
         assert self.completions is not None
         if isinstance(self.completions, Sequence):
             raise_if_exception(self.completions[self.index])
@@ -79,6 +86,13 @@ class MockAsyncClientV2:
         return response
 
 
+def get_mock_chat_kwargs(async_client: AsyncClientV2) -> list[dict[str, Any]]:
+    if isinstance(async_client, MockAsyncClientV2):
+        return async_client.chat_kwargs
+    else:  # pragma: no cover
+        raise RuntimeError('Not a MockAsyncClientV2 instance')
+
+
 def completion_message(message: AssistantMessageResponse, *, usage: cohere.Usage | None = None) -> ChatResponse:
     return ChatResponse(
         id='123',
@@ -124,6 +138,51 @@ async def test_request_simple_success(allow_model_requests: None):
     )
 
 
+async def test_request_model_settings(allow_model_requests: None):
+    c = completion_message(AssistantMessageResponse(content=[TextAssistantMessageResponseContentItem(text='world')]))
+    mock_client = MockAsyncClientV2.create_mock(c)
+    m = CohereModel('command-r7b-12-2024', provider=CohereProvider(cohere_client=mock_client))
+    agent = Agent(m)
+
+    result = await agent.run(
+        'hello',
+        model_settings={
+            'max_tokens': 10,
+            'stop_sequences': ['stop'],
+            'temperature': 0.0,
+            'top_p': 0.5,
+            'seed': 42,
+            'presence_penalty': 0.1,
+            'frequency_penalty': 0.2,
+        },
+    )
+    assert result.output == 'world'
+    kwargs = get_mock_chat_kwargs(mock_client)[0]
+    assert {k: v for k, v in kwargs.items() if k not in ('model', 'messages', 'tools', 'tool_choice')} == snapshot(
+        {
+            'max_tokens': 10,
+            'stop_sequences': ['stop'],
+            'temperature': 0.0,
+            'p': 0.5,
+            'seed': 42,
+            'presence_penalty': 0.1,
+            'frequency_penalty': 0.2,
+        }
+    )
+
+
+async def test_request_tool_choice_setting(allow_model_requests: None):
+    c = completion_message(AssistantMessageResponse(content=[TextAssistantMessageResponseContentItem(text='world')]))
+    mock_client = MockAsyncClientV2.create_mock(c)
+    m = CohereModel('command-r7b-12-2024', provider=CohereProvider(cohere_client=mock_client))
+    agent = Agent(m)
+
+    await agent.run('hello')
+    mock_client.index = 0  # type: ignore
+    await agent.run('hello', model_settings={'tool_choice': 'none'})
+    assert [kwargs['tool_choice'] for kwargs in get_mock_chat_kwargs(mock_client)] == snapshot([OMIT, 'NONE'])
+
+
 async def test_request_simple_usage(allow_model_requests: None):
     c = completion_message(
         AssistantMessageResponse(
@@ -324,6 +383,75 @@ async def test_request_tool_call(allow_model_requests: None):
     )
 
 
+def test_get_tools_reuses_mapped_tools():
+    m = CohereModel('command-r7b-12-2024', provider=CohereProvider(api_key='foobar'))
+    schema = {'type': 'object', 'properties': {'loc_name': {'type': 'string'}}}
+
+    def params(description: str) -> ModelRequestParameters:
+        return ModelRequestParameters(
+            function_tools=[
+                ToolDefinition(name='get_location', description=description, parameters_json_schema=schema)
+            ],
+            allow_text_output=True,
+            output_tools=[],
+        )
+
+    tools = m._get_tools(params('Get a location'))  # pyright: ignore[reportPrivateUsage]
+    assert [t.function.name for t in tools if t.function] == ['get_location']
+    assert m._get_tools(params('Get a location')) is tools  # pyright: ignore[reportPrivateUsage]
+    assert m._get_tools(params('Get the location')) is not tools  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_request_tools_prepared_in_place(allow_model_requests: None):
+    responses = [
+        completion_message(
+            AssistantMessageResponse(
+                role='assistant',
+                tool_calls=[
+                    ToolCallV2(
+                        id='1',
+                        function=ToolCallV2Function(arguments='{"loc_name": "London"}', name='get_location'),
+                        type='function',
+                    )
+                ],
+            )
+        ),
+        completion_message(
+            AssistantMessageResponse(content=[TextAssistantMessageResponseContentItem(text='final response')])
+        ),
+    ]
+    mock_client = MockAsyncClientV2.create_mock(responses)
+    m = CohereModel('command-r7b-12-2024', provider=CohereProvider(cohere_client=mock_client))
+    agent = Agent(m)
+
+    async def prepare_get_location(ctx: RunContext[None], tool_def: ToolDefinition) -> ToolDefinition:
+        # edits the schema the tool shares between steps in place
+        tool_def.parameters_json_schema['description'] = f'Step {ctx.run_step}'
+        return tool_def
+
+    @agent.tool_plain(prepare=prepare_get_location)
+    async def get_location(loc_name: str) -> str:
+        return json.dumps({'lat': 51, 'lng': 0})
+
+    result = await agent.run('hello')
+    assert result.output == 'final response'
+    assert [
+        [t.function.parameters['description'] for t in kwargs['tools'] if t.function and t.function.parameters]
+        for kwargs in get_mock_chat_kwargs(mock_client)
+    ] == snapshot([['Step 1'], ['Step 2']])
+
+
+def test_map_response_joins_texts():
+    m = CohereModel('command-r7b-12-2024', provider=CohereProvider(api_key='foobar'))
+    [single] = m._map_message(ModelResponse(parts=[TextPart(content='world')]))  # pyright: ignore[reportPrivateUsage]
+    [joined] = m._map_message(  # pyright: ignore[reportPrivateUsage]
+        ModelResponse(parts=[TextPart(content='hello'), TextPart(content='world')])
+    )
+    assert isinstance(single, AssistantChatMessageV2) and isinstance(joined, AssistantChatMessageV2)
+    assert single.content == [TextAssistantMessageContentItem(text='world')]
+    assert joined.content == [TextAssistantMessageContentItem(text='hello\n\nworld')]
+
+
 async def test_multimodal(allow_model_requests: None):
     c = completion_message(AssistantMessageResponse(content=[TextAssistantMessageResponseContentItem(text='world')]))
     mock_client = MockAsyncClientV2.create_mock(c)
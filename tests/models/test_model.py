@@ -1,9 +1,11 @@
 from importlib import import_module
 
+import httpx
 import pytest
+from pytest_mock import MockerFixture
 
 from pydantic_ai import UserError
-from pydantic_ai.models import infer_model
+from pydantic_ai.models import _cached_async_http_transport, infer_model  # pyright: ignore[reportPrivateUsage]
 
 from ..conftest import TestEnv
 
@@ -113,3 +115,16 @@ def test_infer_model(
 def test_infer_str_unknown():
     with pytest.raises(UserError, match='Unknown model: foobar'):
         infer_model('foobar')
+
+
+def test_cached_async_http_transport_keeps_connections_alive(mocker: MockerFixture):
+    mock_transport = mocker.patch('httpx.AsyncHTTPTransport')
+    _cached_async_http_transport.cache_clear()
+    try:
+        assert _cached_async_http_transport() is mock_transport.return_value
+    finally:
+        _cached_async_http_transport.cache_clear()
+
+    mock_transport.assert_called_once_with(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+    )
@@ -4,7 +4,7 @@ import pytest
 
 from pydantic_ai import Agent
 from pydantic_ai.models import Model
-from pydantic_ai.settings import ModelSettings
+from pydantic_ai.settings import ModelSettings, merge_model_settings
 
 pytestmark = [pytest.mark.anyio, pytest.mark.vcr]
 
@@ -40,3 +40,14 @@ async def test_stop_settings(allow_model_requests: None, model: Model) -> None:
         assert result.output.endswith('Paris')
     else:
         assert 'Paris' not in result.output
+
+
+def test_merge_model_settings():
+    base = ModelSettings(temperature=0.5, max_tokens=10)
+    overrides = ModelSettings(temperature=0.0)
+    assert merge_model_settings(base, overrides) == {'temperature': 0.0, 'max_tokens': 10}
+    assert base == {'temperature': 0.5, 'max_tokens': 10}
+    assert merge_model_settings(base, None) is base
+    assert merge_model_settings(None, overrides) is overrides
+    assert merge_model_settings(base, base) is base
+    assert merge_model_settings(None, None) is None